@@ -19,6 +19,7 @@ __all__ = [
 ]
 
 SSSOM_BUILT_IN_PREFIXES = ("sssom", "owl", "rdf", "rdfs", "skos", "semapv")
+_BUILT_IN_PREFIX_SET = frozenset(SSSOM_BUILT_IN_PREFIXES)
 SSSOM_CONTEXT = importlib_resources.files("sssom_schema").joinpath(
     "context/sssom_schema.context.jsonld"
 )
@@ -32,31 +33,40 @@ def get_converter() -> Converter:
 
 @lru_cache(1)
 def _get_default_converter() -> Converter:
-    converter = Converter.from_extended_prefix_map(EXTENDED_PREFIX_MAP)
+    with open(EXTENDED_PREFIX_MAP) as file:
+        epm = json.load(file)
+    # Drop non-NCName prefixes and prefix synonyms in the same pass that
+    # reads the records, so the converter only gets built (and validated) once
     records = []
-    for record in converter.records:
-        if not is_ncname(record.prefix):
+    for record in epm:
+        if not is_ncname(record["prefix"]):
             continue
-        record.prefix_synonyms = [s for s in record.prefix_synonyms if is_ncname(s)]
+        if "prefix_synonyms" in record:
+            record["prefix_synonyms"] = [s for s in record["prefix_synonyms"] if is_ncname(s)]
         records.append(record)
-    return Converter(records)
+    return Converter.from_extended_prefix_map(records)
 
 
+@lru_cache(1)
 def _load_sssom_context():
+    """Load the SSSOM JSON-LD context, which is cached and should not be modified in place."""
     with open(SSSOM_CONTEXT) as file:
         return json.load(file, strict=False)
 
 
+#: The URI prefixes for the :data:`SSSOM_BUILT_IN_PREFIXES`, as defined in the SSSOM context.
+#: Parsed JSON only contains exact builtin types, so a type identity check suffices.
+_BUILT_IN_PREFIX_MAP = {
+    prefix: uri_prefix
+    for prefix, uri_prefix in _load_sssom_context()["@context"].items()
+    if prefix in _BUILT_IN_PREFIX_SET and type(uri_prefix) is str
+}
+
+
 @lru_cache(1)
 def _get_built_in_prefix_map() -> Converter:
     """Get URI prefixes for built-in prefixes."""
-    context = _load_sssom_context()
-    prefix_map = {
-        prefix: uri_prefix
-        for prefix, uri_prefix in context["@context"].items()
-        if prefix in SSSOM_BUILT_IN_PREFIXES and isinstance(uri_prefix, str)
-    }
-    return Converter.from_prefix_map(prefix_map)
+    return Converter.from_prefix_map(_BUILT_IN_PREFIX_MAP)
 
 
 #: A type hint that specifies a place where one of three options can be given:
@@ -96,4 +106,18 @@ def ensure_converter(prefix_map: ConverterHint = None, *, use_defaults: bool = T
             return _get_built_in_prefix_map()
     if not isinstance(prefix_map, Converter):
         prefix_map = Converter.from_prefix_map(prefix_map)
-    return curies.chain([_get_built_in_prefix_map(), prefix_map])
+    return _chain_built_in_prefix_map(prefix_map)
+
+
+def _chain_built_in_prefix_map(converter: Converter) -> Converter:
+    """Chain the built-in prefix map in front of a converter, unless it is already there.
+
+    Converters that went through this function before (including the default converter
+    from :func:`get_converter`) already start with the built-in records. Chaining them
+    again would give back an identical converter, which is expensive for large ones.
+    """
+    built_in_converter = _get_built_in_prefix_map()
+    built_in_records = built_in_converter.records
+    if converter.records[: len(built_in_records)] == built_in_records:
+        return converter
+    return curies.chain([built_in_converter, converter])
@@ -181,7 +181,8 @@ def extract_iris(
     :return: A list of IRIs.
     """
     if isinstance(input, (str, Path)) and os.path.isfile(input):
-        pred_list = Path(input).read_text().splitlines()
+        # Predicate files can list the same CURIE or IRI many times, so only look up each once
+        pred_list = set(Path(input).read_text().splitlines())
         return sorted(set(chain.from_iterable(extract_iris(p, converter) for p in pred_list)))
     if isinstance(input, list):
         return sorted(set(chain.from_iterable(extract_iris(p, converter) for p in input)))
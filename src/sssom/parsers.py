@@ -148,7 +148,9 @@ def _read_pandas_and_metadata(input: io.StringIO, sep: str = None):
     table_stream, metadata_stream = _separate_metadata_and_table_from_stream(input)
 
     try:
-        df = pd.read_csv(table_stream, sep=sep, dtype=str, engine="python")
+        # The C engine is much faster, but only the Python engine can sniff the separator
+        engine = "python" if sep is None else "c"
+        df = pd.read_csv(table_stream, sep=sep, dtype=str, engine=engine)
         df.fillna("", inplace=True)
     except EmptyDataError as e:
         logging.warning(f"Seems like the dataframe is empty: {e}")
@@ -214,24 +216,27 @@ def _check_redefined_builtin_prefixes(sssom_metadata, meta, prefix_map):
     # There are three ways in which prefixes can be communicated, so we will check all of them
     # This is a bit overly draconian, as in the end, only the highest priority one gets picked
     # But since this only constitues a (logging) warning, I think its worth reporting
-    builtin_converter = _get_built_in_prefix_map()
+
+    # Converter.bimap is rebuilt on every access, so get each prefix map only once
+    builtin_bimap = _get_built_in_prefix_map().bimap
+    # NOTE during refactor replace the following line by https://github.com/biopragmatics/curies/pull/136
+    reverse_bimap = {value: key for key, value in builtin_bimap.items()}
     sssom_metadata_converter = _get_converter_pop_replace_curie_map(sssom_metadata)
     meta_converter = _get_converter_pop_replace_curie_map(meta)
     prefix_map_converter = ensure_converter(prefix_map, use_defaults=False)
     is_valid_prefixes = True
 
     for converter in [sssom_metadata_converter, meta_converter, prefix_map_converter]:
-        for builtin_prefix, builtin_uri in builtin_converter.bimap.items():
-            if builtin_prefix in converter.bimap:
-                if builtin_uri != converter.bimap[builtin_prefix]:
-                    logging.warning(
-                        f"A built-in prefix ({builtin_prefix}) was provided, "
-                        f"but the provided URI expansion ({converter.bimap[builtin_prefix]}) does not correspond "
-                        f"to the required URI expansion: {builtin_uri}. The prefix will be ignored."
-                    )
-                    is_valid_prefixes = False
-            # NOTE during refactor replace the following line by https://github.com/biopragmatics/curies/pull/136
-            reverse_bimap = {value: key for key, value in builtin_converter.bimap.items()}
+        bimap = converter.bimap
+        for builtin_prefix, builtin_uri in builtin_bimap.items():
+            provided_uri = bimap.get(builtin_prefix)
+            if provided_uri is not None and provided_uri != builtin_uri:
+                logging.warning(
+                    f"A built-in prefix ({builtin_prefix}) was provided, "
+                    f"but the provided URI expansion ({provided_uri}) does not correspond "
+                    f"to the required URI expansion: {builtin_uri}. The prefix will be ignored."
+                )
+                is_valid_prefixes = False
             if builtin_uri in reverse_bimap:
                 if builtin_prefix != reverse_bimap[builtin_uri]:
                     logging.warning(
@@ -5,6 +5,7 @@ import json
 import logging as _logging
 import os
 import re
+import sys
 from collections import ChainMap, defaultdict
 from dataclasses import dataclass, field
 from functools import partial, reduce
@@ -64,7 +65,7 @@ from .constants import (
 from .context import (
     SSSOM_BUILT_IN_PREFIXES,
     ConverterHint,
-    _get_built_in_prefix_map,
+    _chain_built_in_prefix_map,
     ensure_converter,
     get_converter,
 )
@@ -87,8 +88,12 @@ pd.options.mode.copy_on_write = True
 # Get the version of pandas as a tuple of integers
 pandas_version = tuple(map(int, pd.__version__.split(".")))
 
+#: Keyword arguments for :func:`dataclasses.dataclass` that give instances ``__slots__``
+#: instead of a per-instance ``__dict__``, on Python versions that support it
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class MappingSetDataFrame:
     """A collection of mappings represented as a DataFrame, together with additional metadata."""
 
@@ -198,7 +203,7 @@ class MappingSetDataFrame:
 
     def clean_context(self) -> None:
         """Clean up the context."""
-        self.converter = curies.chain([_get_built_in_prefix_map(), self.converter])
+        self.converter = _chain_built_in_prefix_map(self.converter)
 
     def standardize_references(self) -> None:
         """Standardize this MSDF's dataframe and metadata with respect to its converter."""
@@ -213,7 +218,12 @@ class MappingSetDataFrame:
                 continue
             if column not in self.df.columns:
                 continue
-            self.df[column] = self.df[column].map(func)
+            # Standardize each distinct reference once. Repeated references
+            # then also share a single string object in the resulting column. Missing
+            # values are left out, since pandas treats None and NaN as the same key
+            values = self.df[column]
+            standardized = {value: func(value) for value in values.dropna().unique()}
+            self.df[column] = values.map(standardized, na_action="ignore")
 
     def _standardize_metadata_references(self, *, raise_on_invalid: bool = False) -> None:
         """Standardize this MSDF's metadata with respect to its converter."""
@@ -359,7 +369,7 @@ def _standardize_metadata(
             metadata[key] = _standardize_curie_or_iri(value, converter=converter)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EntityPair:
     """
     A tuple of entities.
@@ -371,14 +381,11 @@ class EntityPair:
     object_entity: Uriorcurie
 
     def __hash__(self) -> int:  # noqa:D105
-        if self.subject_entity <= self.object_entity:
-            t = self.subject_entity, self.object_entity
-        else:
-            t = self.object_entity, self.subject_entity
-        return hash(t)
+        a, b = self.subject_entity, self.object_entity
+        return hash((a, b) if a <= b else (b, a))
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MappingSetDiff:
     """
     Represents a difference between two mapping sets.
@@ -438,30 +445,11 @@ def filter_redundant_rows(df: pd.DataFrame, ignore_predicate: bool = False) -> p
         key = [SUBJECT_ID, OBJECT_ID]
     else:
         key = [SUBJECT_ID, OBJECT_ID, PREDICATE_ID]
-    dfmax: pd.DataFrame
     if not df.empty:
-        dfmax = df.groupby(key, as_index=False)[CONFIDENCE].apply(max).drop_duplicates()
-        max_conf: Dict[Tuple[str, ...], float] = {}
-        for _, row in dfmax.iterrows():
-            if ignore_predicate:
-                max_conf[(row[SUBJECT_ID], row[OBJECT_ID])] = row[CONFIDENCE]
-            else:
-                max_conf[(row[SUBJECT_ID], row[OBJECT_ID], row[PREDICATE_ID])] = row[CONFIDENCE]
-        if ignore_predicate:
-            df = df[
-                df.apply(
-                    lambda x: x[CONFIDENCE] >= max_conf[(x[SUBJECT_ID], x[OBJECT_ID])],
-                    axis=1,
-                )
-            ]
-        else:
-            df = df[
-                df.apply(
-                    lambda x: x[CONFIDENCE]
-                    >= max_conf[(x[SUBJECT_ID], x[OBJECT_ID], x[PREDICATE_ID])],
-                    axis=1,
-                )
-            ]
+        # Broadcast the maximum confidence of each group back onto its rows,
+        # so the comparison happens column-wise instead of row by row
+        max_confidence = df.groupby(key, dropna=False)[CONFIDENCE].transform("max")
+        df = df[df[CONFIDENCE] >= max_confidence]
     # We are preserving confidence = NaN rows without making assumptions.
     # This means that there are potential duplicate mappings
 
@@ -586,10 +574,15 @@ def create_entity(identifier: str, mappings: Dict[str, Any]) -> Uriorcurie:
 
 def group_mappings(df: pd.DataFrame) -> Dict[EntityPair, List[pd.Series]]:
     """Group mappings by EntityPairs."""
-    mappings: DefaultDict[EntityPair, List[pd.Series]] = defaultdict(list)
+    # Group on plain (subject, object) tuples, which hash and compare in C,
+    # and only create the entities and pairs once per group
+    groups: DefaultDict[Tuple[str, str], List[pd.Series]] = defaultdict(list)
     for _, row in df.iterrows():
+        groups[row[SUBJECT_ID], row[OBJECT_ID]].append(row)
+    mappings: Dict[EntityPair, List[pd.Series]] = {}
+    for (subject_id, object_id), rows in groups.items():
         subject_entity = create_entity(
-            identifier=row[SUBJECT_ID],
+            identifier=subject_id,
             mappings={
                 "label": SUBJECT_LABEL,
                 "category": SUBJECT_CATEGORY,
@@ -597,15 +590,15 @@ def group_mappings(df: pd.DataFrame) -> Dict[EntityPair, List[pd.Series]]:
             },
         )
         object_entity = create_entity(
-            identifier=row[OBJECT_ID],
+            identifier=object_id,
             mappings={
                 "label": OBJECT_LABEL,
                 "category": OBJECT_CATEGORY,
                 "source": OBJECT_SOURCE,
             },
         )
-        mappings[EntityPair(subject_entity, object_entity)].append(row)
-    return dict(mappings)
+        mappings[EntityPair(subject_entity, object_entity)] = rows
+    return mappings
 
 
 def compare_dataframes(df1: pd.DataFrame, df2: pd.DataFrame) -> MappingSetDiff:
@@ -689,16 +682,19 @@ def dataframe_to_ptable(
 
     df = collapse(df)
     rows = []
-    for _, row in df.iterrows():
-        subject_id = row[SUBJECT_ID]
-        object_id = row[OBJECT_ID]
-        confidence = row[CONFIDENCE]
+    # Iterate over the columns directly, since building a Series per row
+    # with :meth:`pandas.DataFrame.iterrows` is slow
+    for subject_id, object_id, predicate, confidence in zip(
+        df[SUBJECT_ID].tolist(),
+        df[OBJECT_ID].tolist(),
+        df[PREDICATE_ID].tolist(),
+        df[CONFIDENCE].tolist(),
+    ):
         # confidence of inverse
         # e.g. if Pr(super) = 0.2, then Pr(sub) = (1-0.2) * IF
         inverse_confidence = (1.0 - confidence) * inverse_factor
         residual_confidence = (1 - (confidence + inverse_confidence)) / 2.0
 
-        predicate = row[PREDICATE_ID]
         if predicate == OWL_EQUIVALENT_CLASS:
             predicate_type = PREDICATE_EQUIVALENT
         elif predicate == SKOS_EXACT_MATCH:
@@ -1130,10 +1126,11 @@ def get_prefixes_used_in_table(df: pd.DataFrame, converter: Converter) -> Set[st
         return prefixes
     sssom_schema_object = _get_sssom_schema_object()
     entity_reference_slots = sssom_schema_object.entity_reference_slots & set(df.columns)
+    # CURIEs repeat a lot across rows (e.g., predicates), so only check each distinct value once
     new_prefixes = {
         converter.parse_curie(row).prefix
         for col in entity_reference_slots
-        for row in df[col]
+        for row in df[col].unique()
         if not _is_iri(row) and _is_curie(row)
         # we don't use the converter here since get_prefixes_used_in_table
         # is often used to identify prefixes that are not properly registered
@@ -1175,16 +1172,20 @@ def filter_out_prefixes(
     """
     if features is None:
         features = KEY_FEATURES
+    if df.empty:
+        return pd.DataFrame(columns=features)
     filter_prefix_set = set(filter_prefixes)
-    rows = []
-    selection = all if require_all_prefixes else any
-
-    for _, row in df.iterrows():
-        prefixes = {get_prefix_from_curie(curie) for curie in row[features]}
-        if not selection(prefix in prefixes for prefix in filter_prefix_set):
-            rows.append(row)
+    # features that are None have an empty prefix here
+    prefixes = _get_prefixes_frame(df, features).fillna("")
+    if require_all_prefixes:
+        # every filter prefix has to appear in at least one of the features
+        matches = pd.Series(True, index=df.index)
+        for prefix in filter_prefix_set:
+            matches &= (prefixes == prefix).any(axis=1)
+    else:
+        matches = prefixes.isin(filter_prefix_set).any(axis=1)
 
-    return pd.DataFrame(rows) if rows else pd.DataFrame(columns=features)
+    return df[~matches] if not matches.all() else pd.DataFrame(columns=features)
 
 
 def filter_prefixes(
@@ -1203,16 +1204,32 @@ def filter_prefixes(
     """
     if features is None:
         features = KEY_FEATURES
+    if df.empty:
+        return pd.DataFrame(columns=features)
     filter_prefix_set = set(filter_prefixes)
-    rows = []
-    selection = all if require_all_prefixes else any
+    prefixes = _get_prefixes_frame(df, features)
+    # features that are None don't count towards the prefixes of a row
+    missing = prefixes.isna()
+    if require_all_prefixes:
+        matches = (prefixes.isin(filter_prefix_set) | missing).all(axis=1)
+    else:
+        matches = (prefixes.isin(filter_prefix_set) & ~missing).any(axis=1)
+
+    return df[matches] if matches.any() else pd.DataFrame(columns=features)
+
+
+def _get_prefixes_frame(df: pd.DataFrame, features: List[str]) -> pd.DataFrame:
+    """Get the prefix of each CURIE in the given columns, as given by :func:`get_prefix_from_curie`.
+
+    Cells that are None stay None, so callers can tell them apart without another pass
+    over the frame. This lets the prefix filters work on whole columns at once instead
+    of row by row.
+    """
+    return df[features].apply(lambda column: column.map(_get_prefix_or_none))
 
-    for _, row in df.iterrows():
-        prefixes = {get_prefix_from_curie(curie) for curie in row[features] if curie is not None}
-        if selection(prefix in filter_prefix_set for prefix in prefixes):
-            rows.append(row)
 
-    return pd.DataFrame(rows) if rows else pd.DataFrame(columns=features)
+def _get_prefix_or_none(curie: Optional[str]) -> Optional[str]:
+    return None if curie is None else get_prefix_from_curie(curie)
 
 
 def raise_for_bad_path(file_path: Union[str, Path]) -> None:
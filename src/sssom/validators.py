@@ -1,12 +1,9 @@
 """Validators."""
 
 import logging
-from typing import Callable, List, Mapping
+from typing import TYPE_CHECKING, Callable, List, Mapping
 
 from jsonschema import ValidationError
-from linkml.validator import ValidationReport, Validator
-from linkml.validator.plugins import JsonschemaValidationPlugin
-from linkml.validator.report import Severity, ValidationResult
 from linkml_runtime.dumpers import json_dumper
 
 from sssom.parsers import to_mapping_set_document
@@ -14,6 +11,9 @@ from sssom.util import MappingSetDataFrame, get_all_prefixes
 
 from .constants import SCHEMA_YAML, SchemaValidationType, _get_sssom_schema_object
 
+if TYPE_CHECKING:
+    from linkml.validator import ValidationReport
+
 
 def validate(
     msdf: MappingSetDataFrame,
@@ -30,12 +30,14 @@ def validate(
         VALIDATION_METHODS[vt](msdf, fail_on_error)
 
 
-def print_linkml_report(report: ValidationReport, fail_on_error: bool = True):
+def print_linkml_report(report: "ValidationReport", fail_on_error: bool = True):
     """Print the error messages in the report. Optionally throw exception.
 
     :param report: A LinkML validation report
     :param fail_on_error: if true, the function will throw an ValidationError exception when there are errors
     """
+    from linkml.validator.report import Severity
+
     validation_errors = 0
 
     if not report.results:
@@ -94,6 +96,10 @@ def validate_json_schema(msdf: MappingSetDataFrame, fail_on_error: bool = True)
     :param msdf: MappingSetDataFrame to eb validated.
     :param fail_on_error: if true, the function will throw an ValidationError exception when there are errors
     """
+    # linkml's validator is slow to import, so only load it when validation is requested
+    from linkml.validator import Validator
+    from linkml.validator.plugins import JsonschemaValidationPlugin
+
     validator = Validator(
         schema=SCHEMA_YAML,
         validation_plugins=[JsonschemaValidationPlugin(closed=False)],
@@ -139,6 +145,8 @@ def check_all_prefixes_in_curie_map(msdf: MappingSetDataFrame, fail_on_error: bo
     :param fail_on_error: if true, the function will throw an ValidationError exception when there are errors
     :raises ValidationError: If all prefixes not in curie_map.
     """
+    from linkml.validator.report import Severity, ValidationReport, ValidationResult
+
     msdf.clean_context()
     missing_prefixes = get_all_prefixes(msdf).difference(msdf.converter.bimap)
     validation_results = []
@@ -168,6 +176,7 @@ def check_strict_curie_format(msdf: MappingSetDataFrame, fail_on_error: bool = T
     import itertools as itt
 
     import pandas as pd
+    from linkml.validator.report import Severity, ValidationReport, ValidationResult
 
     msdf.clean_context()
     validation_results = []
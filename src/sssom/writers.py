@@ -466,15 +466,19 @@ def to_fhir_json(msdf: MappingSetDataFrame) -> Dict:
 
 def _update_sssom_context_with_prefixmap(converter: Converter):
     """Prepare a JSON-LD context and dump to a string."""
-    context = _load_sssom_context()
-    for k, v in converter.bimap.items():
-        if k in context["@context"] and context["@context"][k] != v:
+    sssom_context = _load_sssom_context()
+    context = sssom_context["@context"]
+    prefix_map = converter.bimap
+    # Only prefixes already in the context can conflict. They are taken in
+    # prefix map order, so the log messages come out in a stable order
+    for k in [k for k in prefix_map if k in context]:
+        if context[k] != prefix_map[k]:
             logging.info(
-                f"{k} namespace is already in the context, ({context['@context'][k]}, "
-                f"but with a different value than {v}. Overwriting!"
+                f"{k} namespace is already in the context, ({context[k]}, "
+                f"but with a different value than {prefix_map[k]}. Overwriting!"
             )
-        context["@context"][k] = v
-    return context
+    # The loaded context is cached, so merge into a copy rather than modifying it
+    return {**sssom_context, "@context": {**context, **prefix_map}}
 
 
 def to_json(msdf: MappingSetDataFrame) -> JsonObj:
@@ -2,6 +2,10 @@
 
 import unittest
 
+import numpy as np
+import pandas as pd
+
+from sssom.constants import CONFIDENCE, OBJECT_ID, PREDICATE_ID, SUBJECT_ID
 from sssom.parsers import parse_sssom_table
 from sssom.util import (
     collapse,
@@ -41,6 +45,19 @@ class TestCollapse(unittest.TestCase):
         df = filter_redundant_rows(self.df)
         self.assertEqual(len(df), 92)
 
+    def test_filter_missing_key(self):
+        """Test that filtering redundant rows keeps rows with a missing predicate."""
+        df = pd.DataFrame(
+            {
+                SUBJECT_ID: ["x:1", "x:1"],
+                PREDICATE_ID: ["skos:exactMatch", np.nan],
+                OBJECT_ID: ["y:1", "y:1"],
+                CONFIDENCE: [0.5, 0.7],
+            }
+        )
+        df = filter_redundant_rows(df)
+        self.assertEqual([0.7, 0.5], list(df[CONFIDENCE]))
+
     def test_ptable(self):
         """Test the row count of the ptable export."""
         rows = dataframe_to_ptable(self.df)
@@ -2,7 +2,11 @@
 
 import unittest
 
-from sssom.context import get_converter
+from sssom.context import (
+    _get_built_in_prefix_map,
+    ensure_converter,
+    get_converter,
+)
 
 
 class TestContext(unittest.TestCase):
@@ -19,3 +23,12 @@ class TestContext(unittest.TestCase):
             "NCBIProtein",
         }
         self.assertLessEqual(expected_prefixes, prefixes)
+
+    def test_ensure_converter_built_in_first(self):
+        """Test that built-in prefixes are only chained in front of a converter once."""
+        converter = ensure_converter({"x": "http://example.org/x/"})
+        self.assertIs(converter, ensure_converter(converter))
+
+        built_in_uri_prefix = _get_built_in_prefix_map().bimap["owl"]
+        converter = ensure_converter({"owl": "http://example.org/owl/"})
+        self.assertEqual(built_in_uri_prefix, converter.bimap["owl"])
@@ -1,6 +1,7 @@
 """Test for merging MappingSetDataFrames."""
 
 import unittest
+from dataclasses import replace
 
 import numpy as np
 import pandas as pd
@@ -22,6 +23,7 @@ from sssom.context import SSSOM_BUILT_IN_PREFIXES, ensure_converter
 from sssom.io import extract_iris
 from sssom.parsers import parse_sssom_table
 from sssom.util import (
+    EntityPair,
     MappingSetDataFrame,
     filter_out_prefixes,
     filter_prefixes,
@@ -37,10 +39,17 @@ from tests.constants import data_dir
 class TestIO(unittest.TestCase):
     """A test case for merging msdfs."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Parse the mapping sets shared by the tests once."""
+        cls._msdf = parse_sssom_table(f"{data_dir}/basic.tsv")
+        cls._msdf2 = parse_sssom_table(f"{data_dir}/basic7.tsv")
+
     def setUp(self) -> None:
         """Set up."""
-        self.msdf = parse_sssom_table(f"{data_dir}/basic.tsv")
-        self.msdf2 = parse_sssom_table(f"{data_dir}/basic7.tsv")
+        # Some tests modify self.msdf in place, so each test gets its own copy
+        self.msdf = replace(self._msdf, df=self._msdf.df.copy(), metadata=dict(self._msdf.metadata))
+        self.msdf2 = self._msdf2
         self.features = [SUBJECT_ID, OBJECT_ID]
         self.mapping_justification = SEMAPV.ManualMappingCuration.value
 
@@ -106,6 +115,16 @@ class TestIO(unittest.TestCase):
         )
         self.assertEqual(len(filtered_df), 101)
 
+    def test_filter_prefixes_empty(self):
+        """Test filtering an empty MSDF.df that lacks some of the key feature columns."""
+        df = pd.DataFrame(columns=[SUBJECT_ID, PREDICATE_ID, OBJECT_ID])
+        for filter_function in [filter_prefixes, filter_out_prefixes]:
+            for require_all_prefixes in [True, False]:
+                filtered_df = filter_function(
+                    df, ["x", "y"], require_all_prefixes=require_all_prefixes
+                )
+                self.assertTrue(filtered_df.empty)
+
     def test_remove_mappings(self):
         """Test remove mappings."""
         prefix_filter_list = ["x", "y"]
@@ -240,6 +259,23 @@ class TestUtils(unittest.TestCase):
             tuple(df.iloc[0]),
         )
 
+    def test_standardize_df_missing_values(self):
+        """Test standardizing a MSDF's dataframe with both None and NaN in a column."""
+        df = pd.DataFrame(
+            {
+                "subject_id": ["a:1", "a:2", "a:3"],
+                "subject_source": pd.Series(["a:src", None, np.nan], dtype=object),
+            }
+        )
+        converter = Converter(
+            [Record(prefix="new.a", prefix_synonyms=["a"], uri_prefix="https://example.org/a/")]
+        )
+        msdf = MappingSetDataFrame(df=df, converter=converter)
+        msdf.standardize_references()
+        self.assertEqual(["new.a:1", "new.a:2", "new.a:3"], msdf.df["subject_id"].tolist())
+        self.assertEqual("new.a:src", msdf.df["subject_source"][0])
+        self.assertTrue(msdf.df["subject_source"][1:].isna().all())
+
     def test_standardize_idempotent(self):
         """Test standardizing leaves correct fields."""
         metadata = {"license": "https://example.org/test-license"}
@@ -446,6 +482,13 @@ class TestUtils(unittest.TestCase):
                 self.assertEqual(value, result_with_mapping_object[key])
                 self.assertEqual(value, result_with_dict[key])
 
+    def test_entity_pair_hash(self):
+        """Test that entity pairs hash the same regardless of order."""
+        pair = EntityPair("x:1", "y:1")
+        self.assertEqual(hash(pair), hash(EntityPair("y:1", "x:1")))
+        self.assertNotEqual(hash(pair), hash(EntityPair("x:1", "y:2")))
+        self.assertEqual(pair, EntityPair("x:1", "y:1"))
+
     def test_curiechain_with_conflicts(self):
         """Test curie map with CURIE/URI clashes."""
         PREFIXMAP_BOTH = {
@@ -18,6 +18,7 @@ from sssom.constants import (
     SUBJECT_ID,
     SUBJECT_LABEL,
 )
+from sssom.context import _load_sssom_context
 from sssom.parsers import parse_sssom_json, parse_sssom_rdf, parse_sssom_table
 from sssom.writers import (
     _update_sssom_context_with_prefixmap,
@@ -126,6 +127,8 @@ class TestWrite(unittest.TestCase):
         self.assertIn("SCTID", context["@context"])
         self.assertNotIn("snomed", context["@context"])
         self.assertIn("mapping_set_id", context["@context"])
+        # the cached SSSOM context is left as it was
+        self.assertNotIn("SCTID", _load_sssom_context()["@context"])
 
     def test_write_sssom_fhir(self):
         """Test writing as FHIR ConceptMap JSON."""